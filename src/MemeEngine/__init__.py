@@ -1,5 +1,6 @@
 """MemeEngine module for creating memes by adding quotes to images."""
 
 from .meme_engine import MemeEngine
+from .output_store import OutputStore
 
-__all__ = ['MemeEngine']
+__all__ = ['MemeEngine', 'OutputStore']
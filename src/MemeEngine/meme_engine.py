@@ -2,7 +2,12 @@
 
 import os
 import random
+import tempfile
+import threading
+import uuid
+from typing import Dict, Iterable
 from PIL import Image, ImageDraw, ImageFont
+from .output_store import OutputStore
 
 
 class MemeEngine:
@@ -10,19 +15,29 @@ class MemeEngine:
 
     This class handles loading images, resizing them, adding quote text
     and author information, and saving the result.
+
+    A single instance is safe to share between threads: output names are
+    unique, files are written atomically, and fonts are cached per thread.
     """
 
-    def __init__(self, output_dir: str):
+    # Image width at which quote text is drawn at its base size; wider
+    # renders scale the text up so it keeps the same relative size.
+    text_base_width = 500
+
+    def __init__(self, output_dir: str, store: OutputStore = None):
         """Initialize the MemeEngine.
 
         Args:
             output_dir: Directory where generated memes will be saved.
+            store: Optional OutputStore that tracks saved memes and
+                evicts old ones (default: memes are kept forever).
         """
         self.output_dir = output_dir
-        
+        self.store = store
+        self._local = threading.local()
+
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
     def _load_image(self, img_path: str) -> Image:
         """Load an image from disk.
@@ -33,14 +48,20 @@ class MemeEngine:
         Returns:
             Loaded PIL Image object.
         """
-        return Image.open(img_path)
+        img = Image.open(img_path)
+        img.load()
+        return img
 
-    def _resize_image(self, img: Image, max_width: int) -> Image:
+    def _resize_image(self, img: Image, max_width: int,
+                      reducing_gap: float = None) -> Image:
         """Resize image to max width while maintaining aspect ratio.
         
         Args:
             img: PIL Image object to resize.
             max_width: Maximum width for the output image.
+            reducing_gap: Optional Pillow reducing gap; when set, large
+                downscales first shrink by an integer factor, which is
+                much faster at a small cost in quality.
             
         Returns:
             Resized PIL Image object.
@@ -48,11 +69,17 @@ class MemeEngine:
         if img.width > max_width:
             ratio = max_width / float(img.width)
             height = int(ratio * float(img.height))
-            img = img.resize((max_width, height), Image.LANCZOS)
+            img = img.resize((max_width, height), Image.LANCZOS,
+                             reducing_gap=reducing_gap)
         return img
 
     def _get_font(self, size: int = 20) -> ImageFont:
         """Load font, falling back to default if unavailable.
+
+        Fonts are cached per thread, so concurrent renders never share a
+        FreeType face and repeated renders skip reloading the font file.
+        The fallback is Pillow's bundled default font at the same size,
+        so text scaling applies on hosts without Arial.
         
         Args:
             size: Font size in points.
@@ -60,59 +87,126 @@ class MemeEngine:
         Returns:
             ImageFont object.
         """
-        try:
-            return ImageFont.truetype('arial.ttf', size)
-        except Exception:
-            return ImageFont.load_default()
+        fonts = getattr(self._local, 'fonts', None)
+        if fonts is None:
+            fonts = self._local.fonts = {}
+
+        if size not in fonts:
+            try:
+                fonts[size] = ImageFont.truetype('arial.ttf', size)
+            except Exception:
+                fonts[size] = ImageFont.load_default(size)
+        return fonts[size]
 
     def _draw_text_with_outline(self, draw: ImageDraw, position: tuple,
-                                 text: str, font: ImageFont):
+                                 text: str, font: ImageFont,
+                                 outline: int = 2):
         """Draw text with outline for visibility.
+
+        The outline uses Pillow's native stroke, so each line is drawn
+        in a single pass whatever the outline thickness.
         
         Args:
             draw: ImageDraw object to draw on.
             position: (x, y) tuple for text position.
             text: Text string to draw.
             font: ImageFont to use for drawing.
+            outline: Outline thickness in pixels.
         """
-        x, y = position
         outline_color = (0, 0, 0)
         text_color = (255, 255, 255)
 
-        for adj_x in range(-2, 3):
-            for adj_y in range(-2, 3):
-                draw.text((x + adj_x, y + adj_y), text,
-                         font=font, fill=outline_color)
-        draw.text(position, text, font=font, fill=text_color)
+        draw.text(position, text, font=font, fill=text_color,
+                  stroke_width=outline, stroke_fill=outline_color)
 
-    def _get_random_position(self, img: Image, margin: int = 10) -> tuple:
+    def _get_random_position(self, img: Image, margin: int = 10,
+                             text_height: int = 100) -> tuple:
         """Calculate random position for text placement.
         
         Args:
             img: PIL Image object to place text on.
             margin: Margin from edges in pixels.
+            text_height: Space to keep free below the text in pixels.
             
         Returns:
             (x, y) tuple for text position.
         """
-        max_y = img.height - 100
+        max_y = img.height - text_height
         y = random.randint(margin, max_y)
         return (margin, y)
 
-    def _save_image(self, img: Image) -> str:
-        """Save image to output directory with random filename.
+    def _save_image(self, img: Image, filename: str = None) -> str:
+        """Save image to output directory with a unique filename.
+
+        The image is written to a temporary file in the output directory
+        and then renamed into place, so readers never see partial files.
         
         Args:
             img: PIL Image object to save.
+            filename: Name for the file (default: a unique meme name).
             
         Returns:
             Path to the saved image file.
         """
-        filename = f'meme_{random.randint(0, 1000000)}.jpg'
+        if filename is None:
+            filename = f'meme_{uuid.uuid4().hex}.jpg'
         out_path = os.path.join(self.output_dir, filename)
-        img.save(out_path)
+
+        ext = os.path.splitext(filename)[1]
+        fd, tmp_path = tempfile.mkstemp(prefix='.meme_', suffix=ext,
+                                        dir=self.output_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                img.save(f, format=Image.registered_extensions()[ext.lower()])
+            # mkstemp creates owner-only files; memes are served publicly
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, out_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self.store is not None:
+            self.store.add(out_path)
         return out_path
 
+    def _render(self, img_path: str, text: str, author: str,
+                width: int) -> Image:
+        """Load an image, resize it and draw the quote onto it.
+
+        Text, outline and spacing are scaled with the rendered width so
+        the result can be downscaled without the text becoming tiny.
+
+        Args:
+            img_path: Path to the input image file.
+            text: The quote text to add to the image.
+            author: The author of the quote.
+            width: Maximum width for the rendered image.
+
+        Returns:
+            The rendered PIL Image object.
+        """
+        # Load and resize
+        img = self._load_image(img_path)
+        img = self._resize_image(img, width)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        scale = max(1.0, img.width / float(self.text_base_width))
+
+        # Add text
+        draw = ImageDraw.Draw(img)
+        font = self._get_font(round(20 * scale))
+        outline = round(2 * scale)
+        x, y = self._get_random_position(img, round(10 * scale),
+                                         round(100 * scale))
+
+        # Draw quote and author
+        self._draw_text_with_outline(draw, (x, y), f'"{text}"', font,
+                                     outline)
+        self._draw_text_with_outline(draw, (x, y + round(25 * scale)),
+                                     f'- {author}', font, outline)
+        return img
+
     def make_meme(self, img_path: str, text: str, author: str, 
                   width: int = 500) -> str:
         """Generate a meme with quote text on an image.
@@ -134,20 +228,69 @@ class MemeEngine:
             Exception: If the image cannot be loaded or processed.
         """
         try:
-            # Load and resize
-            img = self._load_image(img_path)
-            img = self._resize_image(img, width)
+            img = self._render(img_path, text, author, width)
+            return self._save_image(img)
+            
+        except Exception as e:
+            raise Exception(f'Error creating meme: {str(e)}')
 
-            # Add text
-            draw = ImageDraw.Draw(img)
-            font = self._get_font()
-            x, y = self._get_random_position(img)
+    def make_meme_variants(self, img_path: str, text: str, author: str,
+                           widths: Iterable[int] = (250, 500, 1000)
+                           ) -> Dict[int, str]:
+        """Generate a meme at several widths from a single render.
 
-            # Draw quote and author
-            self._draw_text_with_outline(draw, (x, y), f'"{text}"', font)
-            self._draw_text_with_outline(draw, (x, y + 25), f'- {author}', font)
+        The image is decoded and the text drawn once at the largest
+        width; the smaller variants are derived from that render by
+        downscaling. Widths larger than the source image collapse onto
+        the source width.
+
+        Args:
+            img_path: Path to the input image file.
+            text: The quote text to add to the image.
+            author: The author of the quote.
+            widths: Maximum widths of the variants to produce.
+
+        Returns:
+            A dict mapping each variant's actual pixel width to the path
+            of the saved image, ordered from smallest to largest.
+
+        Raises:
+            ValueError: If widths is empty or has a width of zero or less.
+            Exception: If the image cannot be loaded or processed.
+        """
+        widths = sorted(set(widths), reverse=True)
+        if not widths:
+            raise ValueError('At least one variant width is required')
+        if widths[-1] <= 0:
+            raise ValueError(f'Variant widths must be positive: {widths}')
+
+        try:
+            img = self._render(img_path, text, author, widths[0])
+
+            variant_id = uuid.uuid4().hex
+            variants = {}
+            for width in widths:
+                variant = self._resize_image(img, width, reducing_gap=2.0)
+                if variant.width in variants:
+                    continue
+                filename = f'meme_{variant_id}_{variant.width}w.jpg'
+                variants[variant.width] = self._save_image(variant, filename)
+
+            return dict(sorted(variants.items()))
 
-            return self._save_image(img)
-            
         except Exception as e:
             raise Exception(f'Error creating meme: {str(e)}')
+
+    @staticmethod
+    def srcset(variants: Dict[int, str]) -> str:
+        """Format meme variants as an HTML srcset attribute value.
+
+        Args:
+            variants: Dict mapping pixel widths to image paths, as
+                returned by make_meme_variants.
+
+        Returns:
+            A srcset string such as "a.jpg 250w, b.jpg 500w".
+        """
+        return ', '.join(f'{path} {width}w'
+                         for width, path in sorted(variants.items()))
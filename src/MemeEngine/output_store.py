@@ -0,0 +1,203 @@
+"""OutputStore class for bounding the files a MemeEngine leaves behind."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+
+class OutputStore:
+    """Track generated files and evict them by age and total size.
+
+    Files are kept in an in-memory index ordered from oldest to newest,
+    so eviction only looks at the front of the index and never has to
+    list the output directory. The directory is scanned once on creation
+    to adopt files left behind by earlier runs: only names MemeEngine
+    writes (meme_*) and its temporary files from writes that crashed
+    before being renamed (.meme_*). Any other file is left alone.
+
+    All methods are safe to call from multiple threads, but the index and
+    limits are per process. When several worker processes share one
+    directory, each enforces its own max_bytes (so the directory can hold
+    up to workers x max_bytes), each only evicts the files it wrote or
+    adopted at startup, and temporary files left by a crashed write are
+    only picked up when a store is next created.
+    """
+
+    adopt_prefixes = ('meme_', '.meme_')
+
+    def __init__(self, directory: str, ttl: float = 3600,
+                 max_bytes: int = None, sweep_interval: float = 60,
+                 min_age: float = 60):
+        """Initialize the OutputStore.
+
+        Args:
+            directory: Directory whose generated files are managed.
+            ttl: Seconds a file is kept before it expires (default: 1h).
+            max_bytes: Maximum total size of retained files, or None for
+                no size limit.
+            sweep_interval: Seconds between background sweeps.
+            min_age: Seconds a file is protected from size eviction, so
+                it can be served before it is removed (default: 60).
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.min_age = min_age
+
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._retained_bytes = 0
+        self._evicted_files = 0
+        self._evicted_bytes = 0
+        self._started_at = time.time()
+        self._stop = threading.Event()
+        self._sweeper = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._adopt_existing()
+
+    def _adopt_existing(self):
+        """Index generated files already in the directory, oldest first."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if (entry.is_file()
+                        and entry.name.startswith(self.adopt_prefixes)):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+
+        for mtime, path, size in sorted(entries):
+            self._index[path] = (mtime, size)
+            self._retained_bytes += size
+
+    def add(self, path: str):
+        """Register a newly written file with the store.
+
+        If a size limit is set, the oldest files older than min_age are
+        evicted until the retained total fits within it again.
+
+        Args:
+            path: Path to the file that was written.
+        """
+        size = os.path.getsize(path)
+        with self._lock:
+            if path in self._index:
+                self._retained_bytes -= self._index.pop(path)[1]
+            self._index[path] = (time.time(), size)
+            self._retained_bytes += size
+            evicted = self._evict_over_size()
+        self._remove(evicted)
+
+    def sweep(self) -> int:
+        """Evict expired files and enforce the size limit.
+
+        Returns:
+            The number of files evicted.
+        """
+        expires_before = time.time() - self.ttl
+        evicted = []
+        with self._lock:
+            while self._index:
+                path, (created, _) = next(iter(self._index.items()))
+                if created > expires_before:
+                    break
+                evicted.append(self._pop(path))
+            evicted.extend(self._evict_over_size())
+        self._remove(evicted)
+        return len(evicted)
+
+    def stats(self) -> Dict[str, float]:
+        """Return retention and eviction statistics.
+
+        Returns:
+            A dict with the number and total size of retained files, the
+            number and total size of evicted files, and the eviction rate
+            in files per second since the store was created.
+        """
+        with self._lock:
+            uptime = max(time.time() - self._started_at, 1e-9)
+            return {
+                'retained_files': len(self._index),
+                'retained_bytes': self._retained_bytes,
+                'evicted_files': self._evicted_files,
+                'evicted_bytes': self._evicted_bytes,
+                'eviction_rate': self._evicted_files / uptime,
+            }
+
+    def start(self):
+        """Start the background sweeper thread if it is not running."""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop.clear()
+        self._sweeper = threading.Thread(target=self._run, daemon=True,
+                                         name='OutputStoreSweeper')
+        self._sweeper.start()
+
+    def stop(self):
+        """Stop the background sweeper thread and wait for it to exit."""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    def _run(self):
+        """Sweep the store every sweep_interval seconds until stopped."""
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f'Error sweeping {self.directory}: {e}')
+
+    def _pop(self, path: str) -> str:
+        """Drop a file from the index and count it as evicted.
+
+        Must be called with the lock held.
+
+        Args:
+            path: Path of the indexed file to drop.
+
+        Returns:
+            The path of the dropped file.
+        """
+        size = self._index.pop(path)[1]
+        self._retained_bytes -= size
+        self._evicted_files += 1
+        self._evicted_bytes += size
+        return path
+
+    def _evict_over_size(self) -> List[str]:
+        """Drop the oldest files until the size limit is met.
+
+        Files younger than min_age are never dropped, so a page can still
+        serve every variant it just rendered. The retained total may then
+        stay over the limit until those files age and a later add or
+        sweep evicts them. Must be called with the lock held.
+
+        Returns:
+            Paths of the dropped files.
+        """
+        evicted = []
+        if self.max_bytes is None:
+            return evicted
+        protected_after = time.time() - self.min_age
+        while self._index and self._retained_bytes > self.max_bytes:
+            path, (created, _) = next(iter(self._index.items()))
+            if created > protected_after:
+                break
+            evicted.append(self._pop(path))
+        return evicted
+
+    def _remove(self, paths: List[str]):
+        """Delete evicted files from disk, ignoring ones already gone.
+
+        Args:
+            paths: Paths of the files to delete.
+        """
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
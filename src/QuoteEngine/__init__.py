@@ -1,7 +1,8 @@
 """QuoteEngine module for ingesting quotes from various file formats.
 
 This module provides classes for parsing quotes from different file types
-including CSV, DOCX, PDF, and TXT files.
+including CSV, DOCX, PDF, and TXT files, and for normalizing and
+deduplicating the quotes they produce.
 """
 
 from .quote_model import QuoteModel
@@ -11,6 +12,7 @@ from .docx_ingestor import DocxIngestor
 from .pdf_ingestor import PDFIngestor
 from .text_ingestor import TextIngestor
 from .ingestor import Ingestor
+from .quote_deduplicator import QuoteDeduplicator
 
 __all__ = [
     'QuoteModel',
@@ -19,5 +21,6 @@ __all__ = [
     'DocxIngestor',
     'PDFIngestor',
     'TextIngestor',
-    'Ingestor'
+    'Ingestor',
+    'QuoteDeduplicator'
 ]
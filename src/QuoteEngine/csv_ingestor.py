@@ -1,6 +1,6 @@
 """CSV file ingestor using pandas library."""
 
-from typing import List
+from typing import Iterator
 import pandas as pd
 from .ingestor_interface import IngestorInterface
 from .quote_model import QuoteModel
@@ -14,16 +14,17 @@ class CSVIngestor(IngestorInterface):
     """
 
     allowed_extensions = ['csv']
+    chunksize = 10000
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a CSV file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse a CSV file and yield QuoteModel objects.
 
         Args:
             path: Path to the CSV file.
 
-        Returns:
-            A list of QuoteModel objects from the CSV file.
+        Yields:
+            QuoteModel objects from the CSV file.
 
         Raises:
             Exception: If the file cannot be ingested or parsed.
@@ -31,17 +32,20 @@ class CSVIngestor(IngestorInterface):
         if not cls.can_ingest(path):
             raise Exception(f'Cannot ingest file: {path}')
 
-        quotes = []
         try:
-            df = pd.read_csv(path, header=0)
-            
-            for _, row in df.iterrows():
-                if 'body' in row and 'author' in row:
-                    body = str(row['body']).strip()
-                    author = str(row['author']).strip()
-                    if body and author:
-                        quotes.append(QuoteModel(body, author))
+            # Read in chunks so only a slice of the file is held at once
+            with pd.read_csv(path, header=0,
+                             chunksize=cls.chunksize) as reader:
+                for df in reader:
+                    if ('body' not in df.columns
+                            or 'author' not in df.columns):
+                        continue
+
+                    for raw_body, raw_author in zip(df['body'],
+                                                    df['author']):
+                        body = str(raw_body).strip()
+                        author = str(raw_author).strip()
+                        if body and author:
+                            yield QuoteModel(body, author)
         except Exception as e:
             raise Exception(f'Error parsing CSV file {path}: {str(e)}')
-
-        return quotes
@@ -1,6 +1,6 @@
 """DOCX file ingestor using python-docx library."""
 
-from typing import List
+from typing import Iterator
 import docx
 from .ingestor_interface import IngestorInterface
 from .quote_model import QuoteModel
@@ -16,14 +16,14 @@ class DocxIngestor(IngestorInterface):
     allowed_extensions = ['docx']
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a DOCX file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse a DOCX file and yield QuoteModel objects.
 
         Args:
             path: Path to the DOCX file.
 
-        Returns:
-            A list of QuoteModel objects from the DOCX file.
+        Yields:
+            QuoteModel objects from the DOCX file.
 
         Raises:
             Exception: If the file cannot be ingested or parsed.
@@ -31,7 +31,6 @@ class DocxIngestor(IngestorInterface):
         if not cls.can_ingest(path):
             raise Exception(f'Cannot ingest file: {path}')
 
-        quotes = []
         try:
             doc = docx.Document(path)
             
@@ -43,8 +42,6 @@ class DocxIngestor(IngestorInterface):
                         body = parts[0].strip().strip('"')
                         author = parts[1].strip()
                         if body and author:
-                            quotes.append(QuoteModel(body, author))
+                            yield QuoteModel(body, author)
         except Exception as e:
             raise Exception(f'Error parsing DOCX file {path}: {str(e)}')
-
-        return quotes
@@ -1,6 +1,6 @@
 """Main Ingestor class that encapsulates all ingestor strategies."""
 
-from typing import List
+from typing import Iterator
 from .ingestor_interface import IngestorInterface
 from .quote_model import QuoteModel
 from .csv_ingestor import CSVIngestor
@@ -19,8 +19,8 @@ class Ingestor(IngestorInterface):
     ingestors = [CSVIngestor, DocxIngestor, PDFIngestor, TextIngestor]
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a file using the appropriate ingestor.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse a file lazily using the appropriate ingestor.
 
         This method automatically selects the correct ingestor based on
         the file extension and delegates the parsing to that ingestor.
@@ -28,14 +28,15 @@ class Ingestor(IngestorInterface):
         Args:
             path: Path to the file to parse.
 
-        Returns:
-            A list of QuoteModel objects from the file.
+        Yields:
+            QuoteModel objects from the file.
 
         Raises:
             Exception: If no suitable ingestor is found for the file type.
         """
         for ingestor in cls.ingestors:
             if ingestor.can_ingest(path):
-                return ingestor.parse(path)
-        
+                yield from ingestor.iter_parse(path)
+                return
+
         raise Exception(f'No compatible ingestor found for file: {path}')
@@ -1,7 +1,7 @@
 """Abstract base class for quote ingestors."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 from .quote_model import QuoteModel
 
 
@@ -30,10 +30,27 @@ class IngestorInterface(ABC):
 
     @classmethod
     @abstractmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse the file and return a list of QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse the file and yield QuoteModel objects one at a time.
 
         This method must be implemented by all concrete ingestor classes.
+        Quotes are produced lazily, so large files can be processed
+        without holding every quote in memory at once.
+
+        Args:
+            path: Path to the file to parse.
+
+        Yields:
+            QuoteModel objects extracted from the file.
+
+        Raises:
+            Exception: If the file cannot be ingested.
+        """
+        pass
+
+    @classmethod
+    def parse(cls, path: str) -> List[QuoteModel]:
+        """Parse the file and return a list of QuoteModel objects.
 
         Args:
             path: Path to the file to parse.
@@ -44,4 +61,4 @@ class IngestorInterface(ABC):
         Raises:
             Exception: If the file cannot be ingested.
         """
-        pass
+        return list(cls.iter_parse(path))
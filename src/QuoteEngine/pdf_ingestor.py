@@ -1,6 +1,6 @@
 """PDF file ingestor using pdftotext CLI utility."""
 
-from typing import List
+from typing import Iterator
 import subprocess
 import os
 import tempfile
@@ -18,17 +18,18 @@ class PDFIngestor(IngestorInterface):
     allowed_extensions = ['pdf']
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a PDF file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse a PDF file and yield QuoteModel objects.
 
         This method uses subprocess to call pdftotext, converts the PDF
-        to a temporary text file, parses it, and cleans up the temp file.
+        to a temporary text file, streams it line by line, and cleans up
+        the temp file once the generator is exhausted or closed.
 
         Args:
             path: Path to the PDF file.
 
-        Returns:
-            A list of QuoteModel objects from the PDF file.
+        Yields:
+            QuoteModel objects from the PDF file.
 
         Raises:
             Exception: If the file cannot be ingested or parsed.
@@ -36,7 +37,6 @@ class PDFIngestor(IngestorInterface):
         if not cls.can_ingest(path):
             raise Exception(f'Cannot ingest file: {path}')
 
-        quotes = []
         tmp = None
         
         try:
@@ -59,7 +59,7 @@ class PDFIngestor(IngestorInterface):
                             body = parts[0].strip().strip('"')
                             author = parts[1].strip()
                             if body and author:
-                                quotes.append(QuoteModel(body, author))
+                                yield QuoteModel(body, author)
         except subprocess.CalledProcessError as e:
             raise Exception(f'Error calling pdftotext for {path}: {str(e)}')
         except Exception as e:
@@ -71,5 +71,3 @@ class PDFIngestor(IngestorInterface):
                     os.remove(tmp.name)
                 except Exception:
                     pass
-
-        return quotes
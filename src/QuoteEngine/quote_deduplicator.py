@@ -0,0 +1,131 @@
+"""Normalization and deduplication stage for ingested quotes."""
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict, Iterable, Iterator, List
+from .quote_model import QuoteModel
+
+
+class QuoteDeduplicator:
+    """Normalize quotes and drop duplicates across multiple sources.
+
+    Quotes are normalized (Unicode NFKC, curly quote marks, stray BOMs
+    and whitespace) and then compared by a hash of their normalized
+    body and author. Only the fixed-size digests are kept, so a single
+    pass over any number of sources runs in linear time.
+
+    With ignore_case_and_punctuation enabled, quotes are instead compared
+    by their case-folded runs of word characters only, so quotes
+    that differ just in case, punctuation or spacing count as the same
+    quote. A body or author with no word characters at all is compared
+    exactly. No fuzzy or similarity matching is performed.
+    """
+
+    _quote_marks = str.maketrans({
+        '\u2018': "'", '\u2019': "'", '\u201a': "'", '\u201b': "'",
+        '\u2032': "'", '\u201c': '"', '\u201d': '"', '\u201e': '"',
+        '\u201f': '"', '\u2033': '"', '\u00ab': '"', '\u00bb': '"',
+    })
+    _invisible = re.compile('[\u200b\u200c\u200d\u2060\ufeff]')
+    _whitespace = re.compile(r'\s+')
+    _words = re.compile(r'\w+')
+
+    def __init__(self, ignore_case_and_punctuation: bool = False):
+        """Initialize the QuoteDeduplicator.
+
+        Args:
+            ignore_case_and_punctuation: Also drop quotes that only differ
+                by case, punctuation or spacing (default: False).
+        """
+        self.ignore_case_and_punctuation = ignore_case_and_punctuation
+        self.dropped: Dict[str, int] = {}
+        self._seen = set()
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """Normalize Unicode, quote marks and whitespace in a string.
+
+        Args:
+            text: The raw text to normalize.
+
+        Returns:
+            The normalized text with surrounding quote marks removed.
+        """
+        text = unicodedata.normalize('NFKC', text)
+        text = cls._invisible.sub('', text).translate(cls._quote_marks)
+        text = cls._whitespace.sub(' ', text).strip()
+        return text.strip('"').strip()
+
+    def _key(self, body: str, author: str) -> bytes:
+        """Build the hash key used to detect duplicate quotes.
+
+        Args:
+            body: The normalized quote body.
+            author: The normalized quote author.
+
+        Returns:
+            A fixed-size digest identifying the quote.
+        """
+        if self.ignore_case_and_punctuation:
+            body = self._words_key(body)
+            author = self._words_key(author)
+        key = f'{body}\x00{author}'.encode('utf-8')
+        return hashlib.blake2b(key, digest_size=16).digest()
+
+    @classmethod
+    def _words_key(cls, text: str) -> str:
+        """Reduce text to its case-folded words, keeping wordless text.
+
+        Args:
+            text: The normalized text to reduce.
+
+        Returns:
+            The words joined by spaces, or the text itself (prefixed so
+            it cannot clash with a word key) if it has no words.
+        """
+        words = cls._words.findall(text.casefold())
+        if not words:
+            return f'\x01{text}'
+        return ' '.join(words)
+
+    def iter_unique(self, quotes: Iterable[QuoteModel],
+                    source: str = '') -> Iterator[QuoteModel]:
+        """Yield normalized quotes that have not been seen before.
+
+        Duplicates are counted against the given source in `dropped`.
+
+        Args:
+            quotes: Quotes to normalize and deduplicate.
+            source: Name of the source the quotes came from.
+
+        Yields:
+            Normalized QuoteModel objects not seen in any earlier source.
+        """
+        self.dropped.setdefault(source, 0)
+        for quote in quotes:
+            body = self.normalize(quote.body)
+            author = self.normalize(quote.author)
+            if not body or not author:
+                continue
+
+            key = self._key(body, author)
+            if key in self._seen:
+                self.dropped[source] += 1
+                continue
+
+            self._seen.add(key)
+            yield QuoteModel(body, author)
+
+    def unique(self, quotes: Iterable[QuoteModel],
+               source: str = '') -> List[QuoteModel]:
+        """Return normalized quotes that have not been seen before.
+
+        Args:
+            quotes: Quotes to normalize and deduplicate.
+            source: Name of the source the quotes came from.
+
+        Returns:
+            A list of normalized QuoteModel objects.
+        """
+        return list(self.iter_unique(quotes, source))
@@ -1,6 +1,6 @@
 """Text file ingestor using native Python file operations."""
 
-from typing import List
+from typing import Iterator
 from .ingestor_interface import IngestorInterface
 from .quote_model import QuoteModel
 
@@ -15,14 +15,14 @@ class TextIngestor(IngestorInterface):
     allowed_extensions = ['txt']
 
     @classmethod
-    def parse(cls, path: str) -> List[QuoteModel]:
-        """Parse a text file and return QuoteModel objects.
+    def iter_parse(cls, path: str) -> Iterator[QuoteModel]:
+        """Parse a text file and yield QuoteModel objects.
 
         Args:
             path: Path to the text file.
 
-        Returns:
-            A list of QuoteModel objects from the text file.
+        Yields:
+            QuoteModel objects from the text file.
 
         Raises:
             Exception: If the file cannot be ingested or parsed.
@@ -30,7 +30,6 @@ class TextIngestor(IngestorInterface):
         if not cls.can_ingest(path):
             raise Exception(f'Cannot ingest file: {path}')
 
-        quotes = []
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 for line in f:
@@ -41,8 +40,6 @@ class TextIngestor(IngestorInterface):
                             body = parts[0].strip().strip('"')
                             author = parts[1].strip()
                             if body and author:
-                                quotes.append(QuoteModel(body, author))
+                                yield QuoteModel(body, author)
         except Exception as e:
             raise Exception(f'Error parsing text file {path}: {str(e)}')
-
-        return quotes
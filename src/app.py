@@ -6,17 +6,22 @@ or custom memes with user-provided images and quotes.
 
 import random
 import os
+import uuid
 import requests
 from flask import Flask, render_template, abort, request
-from QuoteEngine import Ingestor, QuoteModel
-from MemeEngine import MemeEngine
+from QuoteEngine import Ingestor, QuoteModel, QuoteDeduplicator
+from MemeEngine import MemeEngine, OutputStore
 
 app = Flask(__name__)
 
 # Get the directory where this script is located
 script_dir = os.path.dirname(os.path.abspath(__file__))
 static_dir = os.path.join(os.path.dirname(script_dir), 'static')
-meme = MemeEngine(static_dir)
+# Expire generated memes after an hour and cap the directory at 500 MB
+# (per worker process; see OutputStore for multi-worker limits)
+store = OutputStore(static_dir, ttl=3600, max_bytes=500 * 1024 * 1024)
+store.start()
+meme = MemeEngine(static_dir, store)
 
 
 def setup():
@@ -37,14 +42,20 @@ def setup():
                    os.path.join(script_dir, '_data/DogQuotes/DogQuotesPDF.pdf'),
                    os.path.join(script_dir, '_data/DogQuotes/DogQuotesCSV.csv')]
 
-    # Use the Ingestor class to parse all files
+    # Use the Ingestor class to parse all files, dropping any quote
+    # already loaded from an earlier file
     quotes = []
+    dedup = QuoteDeduplicator()
     for file in quote_files:
         try:
-            quotes.extend(Ingestor.parse(file))
+            quotes.extend(dedup.iter_unique(Ingestor.iter_parse(file), file))
         except Exception as e:
             print(f'Error loading quotes from {file}: {e}')
 
+    for file, dropped in dedup.dropped.items():
+        if dropped:
+            print(f'Dropped {dropped} duplicate quotes from {file}')
+
     images_path = os.path.join(script_dir, "_data/photos/dog/")
 
     # Find all images in the directory
@@ -58,6 +69,22 @@ def setup():
 quotes, imgs = setup()
 
 
+def render_meme(variants):
+    """Render the meme page for a set of meme size variants.
+
+    Args:
+        variants: Dict mapping pixel widths to meme image paths.
+
+    Returns:
+        Rendered template showing the responsive meme image.
+    """
+    # Fall back to the 500px variant for clients without srcset support
+    small = [width for width in variants if width <= 500]
+    path = variants[max(small) if small else min(variants)]
+    return render_template('meme.html', path=path,
+                           srcset=MemeEngine.srcset(variants))
+
+
 @app.route('/')
 def meme_rand():
     """Generate a random meme.
@@ -72,8 +99,8 @@ def meme_rand():
     img = random.choice(imgs)
     quote = random.choice(quotes)
     
-    path = meme.make_meme(img, quote.body, quote.author)
-    return render_template('meme.html', path=path)
+    variants = meme.make_meme_variants(img, quote.body, quote.author)
+    return render_meme(variants)
 
 
 @app.route('/create', methods=['GET'])
@@ -120,14 +147,14 @@ def meme_post():
         response.raise_for_status()
         
         # Save to temporary file
-        tmp_img_path = f'./tmp/downloaded_{random.randint(0, 1000000)}.jpg'
+        tmp_img_path = f'./tmp/downloaded_{uuid.uuid4().hex}.jpg'
         os.makedirs('./tmp', exist_ok=True)
         
         with open(tmp_img_path, 'wb') as img_file:
             img_file.write(response.content)
         
         # Generate the meme
-        path = meme.make_meme(tmp_img_path, body, author)
+        variants = meme.make_meme_variants(tmp_img_path, body, author)
         
     except requests.RequestException as e:
         return render_template('meme_form.html', 
@@ -143,7 +170,7 @@ def meme_post():
             except Exception:
                 pass
 
-    return render_template('meme.html', path=path)
+    return render_meme(variants)
 
 
 if __name__ == "__main__":
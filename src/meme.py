@@ -7,7 +7,7 @@ quotes. Users can specify custom images and quotes or use random ones.
 import os
 import random
 import argparse
-from QuoteEngine import Ingestor, QuoteModel
+from QuoteEngine import Ingestor, QuoteModel, QuoteDeduplicator
 from MemeEngine import MemeEngine
 
 
@@ -52,9 +52,10 @@ def generate_meme(path=None, body=None, author=None):
                        os.path.join(script_dir, '_data/DogQuotes/DogQuotesPDF.pdf'),
                        os.path.join(script_dir, '_data/DogQuotes/DogQuotesCSV.csv')]
         quotes = []
+        dedup = QuoteDeduplicator()
         for f in quote_files:
             try:
-                quotes.extend(Ingestor.parse(f))
+                quotes.extend(dedup.iter_unique(Ingestor.iter_parse(f), f))
             except Exception as e:
                 print(f'Error loading quotes from {f}: {e}')
 
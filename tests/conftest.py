@@ -0,0 +1,6 @@
+"""Pytest configuration that puts the src/ packages on the import path."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,59 @@
+"""Tests for MemeEngine rendering."""
+
+import os
+
+import pytest
+from PIL import Image, ImageDraw
+
+from MemeEngine import MemeEngine
+
+
+def test_font_size_applies_without_arial(tmp_path):
+    """The requested font size applies even with the fallback font."""
+    engine = MemeEngine(str(tmp_path))
+    draw = ImageDraw.Draw(Image.new('RGB', (10, 10)))
+
+    small = draw.textbbox((0, 0), 'Bork', font=engine._get_font(20))
+    large = draw.textbbox((0, 0), 'Bork', font=engine._get_font(40))
+
+    assert large[3] - large[1] > 1.5 * (small[3] - small[1])
+
+
+def test_make_meme_variants_sizes(tmp_path):
+    """Each variant is saved at its width, clipped to the source width."""
+    src = tmp_path / 'src.jpg'
+    Image.new('RGB', (800, 600), 'blue').save(src)
+    engine = MemeEngine(str(tmp_path / 'out'))
+
+    variants = engine.make_meme_variants(str(src), 'Bork', 'Rex',
+                                         widths=(250, 500, 1000))
+
+    assert list(variants) == [250, 500, 800]
+    for width, path in variants.items():
+        with Image.open(path) as img:
+            assert img.width == width
+    assert MemeEngine.srcset(variants).endswith(f'{variants[800]} 800w')
+
+
+def test_make_meme_variants_accepts_generator(tmp_path):
+    """A one-shot iterable of widths still yields every variant."""
+    src = tmp_path / 'src.jpg'
+    Image.new('RGB', (800, 600), 'blue').save(src)
+    engine = MemeEngine(str(tmp_path / 'out'))
+
+    variants = engine.make_meme_variants(str(src), 'Bork', 'Rex',
+                                         widths=(w for w in (250, 500)))
+
+    assert list(variants) == [250, 500]
+
+
+@pytest.mark.parametrize('widths', [(), (500, 0), (-250,)])
+def test_make_meme_variants_rejects_bad_widths(tmp_path, widths):
+    """Empty or non-positive widths raise a clear ValueError."""
+    src = tmp_path / 'src.jpg'
+    Image.new('RGB', (800, 600), 'blue').save(src)
+    engine = MemeEngine(str(tmp_path / 'out'))
+
+    with pytest.raises(ValueError):
+        engine.make_meme_variants(str(src), 'Bork', 'Rex', widths=widths)
+    assert os.listdir(tmp_path / 'out') == []
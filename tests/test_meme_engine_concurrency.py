@@ -0,0 +1,43 @@
+"""Load test for sharing one MemeEngine between many threads."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from MemeEngine import MemeEngine
+
+THREADS = 32
+RENDERS = 2000
+WIDTHS = (100, 200, 400)
+
+
+def test_concurrent_renders_do_not_collide(tmp_path):
+    """Thousands of parallel renders produce distinct, valid files."""
+    src = tmp_path / 'src.jpg'
+    Image.new('RGB', (400, 300), 'blue').save(src)
+    out_dir = tmp_path / 'out'
+    engine = MemeEngine(str(out_dir))
+
+    def render(i):
+        if i % 4 == 0:
+            variants = engine.make_meme_variants(str(src), f'Quote {i}',
+                                                 'Rex', widths=WIDTHS)
+            return list(variants.values())
+        return [engine.make_meme(str(src), f'Quote {i}', 'Rex', width=200)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        paths = [p for group in pool.map(render, range(RENDERS))
+                 for p in group]
+
+    expected = RENDERS // 4 * len(WIDTHS) + RENDERS - RENDERS // 4
+    assert len(paths) == expected
+    assert len(set(paths)) == expected
+
+    names = os.listdir(out_dir)
+    assert len(names) == expected
+    assert not [name for name in names if name.startswith('.')]
+
+    for path in paths:
+        with Image.open(path) as img:
+            img.verify()
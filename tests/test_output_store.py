@@ -0,0 +1,114 @@
+"""Tests for OutputStore eviction and accounting."""
+
+import os
+import time
+
+from MemeEngine import OutputStore
+
+
+def write(directory, name, size):
+    """Write a file of the given size and return its path."""
+    path = os.path.join(str(directory), name)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+
+def test_sweep_expires_files_past_ttl(tmp_path):
+    """Files older than the TTL are removed, newer ones are kept."""
+    store = OutputStore(str(tmp_path), ttl=60)
+    old = write(tmp_path, 'old.jpg', 10)
+    store.add(old)
+    store._index[old] = (time.time() - 120, 10)
+    new = write(tmp_path, 'new.jpg', 10)
+    store.add(new)
+
+    assert store.sweep() == 1
+    assert not os.path.exists(old)
+    assert os.path.exists(new)
+
+
+def test_size_eviction_removes_oldest_first(tmp_path):
+    """Over the size limit, files are evicted oldest first."""
+    store = OutputStore(str(tmp_path), max_bytes=25, min_age=0)
+    paths = [write(tmp_path, f'{i}.jpg', 10) for i in range(4)]
+    for path in paths:
+        store.add(path)
+
+    assert [os.path.exists(p) for p in paths] == [False, False, True, True]
+    assert store.stats()['retained_bytes'] == 20
+
+
+def test_size_eviction_spares_recent_files(tmp_path):
+    """Files younger than min_age survive even when over the limit."""
+    store = OutputStore(str(tmp_path), max_bytes=15, min_age=60)
+    paths = [write(tmp_path, f'{i}_{w}w.jpg', 10)
+             for i, w in enumerate((1000, 500, 250))]
+    for path in paths:
+        store.add(path)
+
+    assert all(os.path.exists(p) for p in paths)
+    assert store.stats()['retained_bytes'] == 30
+
+
+def test_readding_path_replaces_entry(tmp_path):
+    """Re-adding a path updates its size without counting an eviction."""
+    store = OutputStore(str(tmp_path))
+    path = write(tmp_path, 'meme.jpg', 10)
+    store.add(path)
+    write(tmp_path, 'meme.jpg', 25)
+    store.add(path)
+
+    stats = store.stats()
+    assert stats['retained_files'] == 1
+    assert stats['retained_bytes'] == 25
+    assert stats['evicted_files'] == 0
+
+
+def test_stats_account_for_adopted_and_evicted_files(tmp_path):
+    """Adopted files, including temp leftovers, are counted and evicted."""
+    write(tmp_path, 'meme_stale.jpg', 7)
+    write(tmp_path, '.meme_abc123.jpg', 3)
+    store = OutputStore(str(tmp_path), ttl=0)
+
+    stats = store.stats()
+    assert stats['retained_files'] == 2
+    assert stats['retained_bytes'] == 10
+
+    assert store.sweep() == 2
+    stats = store.stats()
+    assert stats['retained_files'] == 0
+    assert stats['retained_bytes'] == 0
+    assert stats['evicted_files'] == 2
+    assert stats['evicted_bytes'] == 10
+    assert stats['eviction_rate'] > 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_background_sweeper_runs_until_stopped(tmp_path):
+    """The sweeper thread expires files without an explicit sweep."""
+    store = OutputStore(str(tmp_path), ttl=0, sweep_interval=0.01)
+    path = write(tmp_path, 'meme.jpg', 10)
+    store.add(path)
+    store.start()
+    try:
+        deadline = time.time() + 5
+        while os.path.exists(path) and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        store.stop()
+
+    assert not os.path.exists(path)
+
+
+def test_files_not_created_by_meme_engine_survive(tmp_path):
+    """Only meme outputs and their temp files are adopted and evicted."""
+    keep = [write(tmp_path, name, 5)
+            for name in ('favicon.ico', 'photo.jpg', '.gitkeep', 'memes.txt')]
+    stale = write(tmp_path, 'meme_stale.jpg', 5)
+    store = OutputStore(str(tmp_path), ttl=0, max_bytes=0, min_age=0)
+
+    assert store.sweep() == 1
+    assert not os.path.exists(stale)
+    assert all(os.path.exists(path) for path in keep)
+    assert store.stats()['retained_files'] == 0
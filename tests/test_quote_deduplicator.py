@@ -0,0 +1,49 @@
+"""Tests for QuoteDeduplicator normalization and deduplication."""
+
+from QuoteEngine import QuoteDeduplicator, QuoteModel
+
+
+def test_normalize_unicode_quote_marks_and_whitespace():
+    """Curly quotes, BOMs and repeated whitespace are normalized away."""
+    text = '\ufeff\u201cTo  bork\tor not\u2019s bork\u201d '
+    assert QuoteDeduplicator.normalize(text) == "To bork or not's bork"
+
+
+def test_exact_duplicates_are_dropped_and_counted_per_source():
+    """Duplicates are dropped and counted against the later source."""
+    dedup = QuoteDeduplicator()
+    first = dedup.unique([QuoteModel('Bork', 'Rex'),
+                          QuoteModel('Bork', 'Rex'),
+                          QuoteModel('Woof', 'Rex')], 'a.txt')
+    second = dedup.unique([QuoteModel('\u201cBork\u201d', ' Rex '),
+                           QuoteModel('Arf', 'Rex')], 'b.csv')
+
+    assert [q.body for q in first] == ['Bork', 'Woof']
+    assert [q.body for q in second] == ['Arf']
+    assert dedup.dropped == {'a.txt': 1, 'b.csv': 1}
+
+
+def test_exact_mode_keeps_case_and_punctuation_variants():
+    """Without the option, case and punctuation differences are kept."""
+    dedup = QuoteDeduplicator()
+    quotes = dedup.unique([QuoteModel('To bork', 'Bork'),
+                           QuoteModel('to bork!', 'bork')])
+    assert len(quotes) == 2
+
+
+def test_ignore_case_and_punctuation_drops_variants():
+    """With the option, case and punctuation differences are dropped."""
+    dedup = QuoteDeduplicator(ignore_case_and_punctuation=True)
+    quotes = dedup.unique([QuoteModel('To bork, or not', 'Bork'),
+                           QuoteModel('to bork or NOT!', 'bork')], 'src')
+    assert [q.body for q in quotes] == ['To bork, or not']
+    assert dedup.dropped == {'src': 1}
+
+
+def test_ignore_case_and_punctuation_keeps_wordless_quotes_apart():
+    """Bodies without word characters fall back to exact comparison."""
+    dedup = QuoteDeduplicator(ignore_case_and_punctuation=True)
+    quotes = dedup.unique([QuoteModel('!!!', 'a'), QuoteModel('???', 'a'),
+                           QuoteModel('!!!', 'a')], 'src')
+    assert [q.body for q in quotes] == ['!!!', '???']
+    assert dedup.dropped == {'src': 1}